@@ -74,13 +74,29 @@ try {
     if (Test-Path "$env:TEMP\InvokeX_download.exe") { Remove-Item "$env:TEMP\InvokeX_download.exe" -Force -EA SilentlyContinue }
 }
 
-# ── 4. Download icon for shortcuts ──
+# ── 4. Download icon for shortcuts (re-fetched only when upstream changes) ──
 $iconPath = Join-Path $installDir "icon.ico"
+$iconTagPath = "$iconPath.etag"
 try {
     $iconUrl = "https://raw.githubusercontent.com/GoblinRules/InvokeX/main/assets/icon1.ico"
-    Invoke-WebRequest -Uri $iconUrl -OutFile $iconPath -UseBasicParsing -ErrorAction Stop
+    # Compare the remote ETag with the one saved next to the cached icon
+    $remoteTag = "$((Invoke-WebRequest -Uri $iconUrl -Method Head -UseBasicParsing -ErrorAction Stop).Headers['ETag'])"
+    $cachedTag = if ((Test-Path $iconPath) -and (Test-Path $iconTagPath)) { (Get-Content $iconTagPath -Raw).Trim() } else { "" }
+    if ($remoteTag -and $remoteTag -eq $cachedTag) {
+        Write-OK "Using existing icon: $iconPath"
+    } else {
+        # Download to a temp name so an interrupted transfer is never mistaken for a cached icon
+        Invoke-WebRequest -Uri $iconUrl -OutFile "$iconPath.part" -UseBasicParsing -ErrorAction Stop
+        Move-Item "$iconPath.part" $iconPath -Force
+        if ($remoteTag) { Set-Content -Path $iconTagPath -Value $remoteTag -NoNewline } else { Remove-Item $iconTagPath -Force -EA SilentlyContinue }
+    }
 } catch {
-    Write-Warn "Could not download icon (shortcuts will use default icon)"
+    if (Test-Path $iconPath) {
+        Write-Warn "Could not check for an updated icon (keeping the existing one)"
+    } else {
+        Write-Warn "Could not download icon (shortcuts will use default icon)"
+    }
+    if (Test-Path "$iconPath.part") { Remove-Item "$iconPath.part" -Force -EA SilentlyContinue }
 }
 
 # ── 5. Create shortcuts ──
@@ -12,11 +12,12 @@
 // ═══════════════════════════════════════════════════════════════
 
 const { app, BrowserWindow, ipcMain, shell, dialog } = require('electron');
-const { spawn, exec, execSync } = require('child_process');
+const { spawn } = require('child_process');
 const path = require('path');
 const fs = require('fs');
 const https = require('https');
 const http = require('http');
+const crypto = require('crypto');
 
 let mainWindow;
 
@@ -81,7 +82,12 @@ function createWindow() {
 // Section 3: App Lifecycle
 // ──────────────────────────────────────────────
 
-app.whenReady().then(createWindow);
+app.whenReady().then(() => {
+    // Start the startup probes now so they overlap window creation
+    checkAdmin();
+    getWindowsVersion();
+    createWindow();
+});
 
 app.on('window-all-closed', () => {
     logStream.end();
@@ -92,15 +98,44 @@ app.on('window-all-closed', () => {
 // Section 4: Admin & Elevation
 // ──────────────────────────────────────────────
 
-// Check if the current process has admin privileges
-ipcMain.handle('check-admin', async () => {
-    try {
-        execSync('net session', { stdio: 'ignore' });
-        return true;
-    } catch {
-        return false;
+// Upper bound for quick local probes (net session, sc query). They normally
+// answer in well under a second; a hung one is treated as a failed check.
+const PROBE_TIMEOUT_MS = 5000;
+
+// Run a probe without blocking the main process. Only stdout is piped: the
+// probes never read stdin and their stderr is never looked at. Resolves with
+// { ok, stdout }; ok is false on a non-zero exit, spawn error or timeout.
+function runProbe(file, args, timeoutMs = PROBE_TIMEOUT_MS) {
+    return new Promise((resolve) => {
+        const child = spawn(file, args, { stdio: ['ignore', 'pipe', 'ignore'], windowsHide: true });
+        const timer = setTimeout(() => child.kill(), timeoutMs);
+        let stdout = '';
+        child.stdout.setEncoding('utf8');
+        child.stdout.on('data', (chunk) => { stdout += chunk; });
+        child.once('error', () => {
+            clearTimeout(timer);
+            resolve({ ok: false, stdout: '' });
+        });
+        child.once('close', (code) => {
+            clearTimeout(timer);
+            resolve({ ok: code === 0, stdout });
+        });
+    });
+}
+
+// Check if the current process has admin privileges. Elevation can't change
+// for the lifetime of the process, so `net session` is only spawned once and
+// every caller shares the same promise.
+let isAdminPromise = null;
+
+function checkAdmin() {
+    if (!isAdminPromise) {
+        isAdminPromise = runProbe('net', ['session']).then(({ ok }) => ok);
     }
-});
+    return isAdminPromise;
+}
+
+ipcMain.handle('check-admin', () => checkAdmin());
 
 // Restart the app elevated (as administrator)
 ipcMain.handle('restart-as-admin', async () => {
@@ -120,10 +155,15 @@ ipcMain.handle('restart-as-admin', async () => {
 
         writeLog('INFO', `Restarting as admin: ${psCommand}`);
 
-        exec(`powershell -NoProfile -ExecutionPolicy Bypass -Command "${psCommand.replace(/"/g, '\\"')}"`, (err) => {
-            if (err) {
-                writeLog('ERROR', `Failed to relaunch as admin: ${err.message}`);
-            }
+        // Spawn PowerShell directly (no cmd.exe in between), passing the
+        // command as a single argv entry so no extra quote-escaping is needed
+        const ps = spawn('powershell', ['-NoProfile', '-ExecutionPolicy', 'Bypass', '-Command', psCommand], {
+            stdio: 'ignore',
+            windowsHide: true
+        });
+        ps.on('error', (err) => writeLog('ERROR', `Failed to relaunch as admin: ${err.message}`));
+        ps.on('close', (code) => {
+            if (code !== 0) writeLog('ERROR', `Failed to relaunch as admin: PowerShell exited with code ${code}`);
         });
 
         // Give the elevated process a moment to launch before quitting
@@ -143,17 +183,25 @@ ipcMain.handle('restart-as-admin', async () => {
 /**
  * Run a PowerShell command with streaming output back to the renderer.
  * Output is sent line-by-line via 'command-output' IPC events.
- * Resolves when the process exits.
+ * Optional stdinText is written to the process's stdin (for secrets that
+ * must stay out of the command line and the log). Resolves when the
+ * process exits.
  */
-ipcMain.handle('run-powershell', async (event, command) => {
+ipcMain.handle('run-powershell', async (event, command, stdinText) => {
     return new Promise((resolve) => {
         writeLog('INFO', `Running PowerShell: ${command}`);
 
+        const hasInput = typeof stdinText === 'string';
         const ps = spawn('powershell', ['-NoProfile', '-ExecutionPolicy', 'Bypass', '-Command', command], {
-            stdio: ['ignore', 'pipe', 'pipe'],
+            stdio: [hasInput ? 'pipe' : 'ignore', 'pipe', 'pipe'],
             windowsHide: true
         });
 
+        if (hasInput) {
+            ps.stdin.on('error', () => { });
+            ps.stdin.end(`${stdinText}\n`);
+        }
+
         ps.stdout.on('data', (data) => {
             const text = data.toString();
             writeLog('INFO', text.trim());
@@ -187,10 +235,13 @@ ipcMain.handle('run-powershell', async (event, command) => {
 ipcMain.handle('run-powershell-window', async (event, command) => {
     writeLog('INFO', `Running PowerShell in new window: ${command}`);
     try {
+        // Hand the command to the elevated window as -EncodedCommand (base64
+        // UTF-16LE) so its quotes and pipes survive without any re-escaping.
+        const encoded = Buffer.from(command, 'utf16le').toString('base64');
         spawn('powershell', [
             '-NoProfile', '-ExecutionPolicy', 'Bypass',
-            '-Command', `Start-Process powershell -ArgumentList '-NoProfile -ExecutionPolicy Bypass -Command "${command.replace(/"/g, '\\"')}"' -Verb RunAs`
-        ], { detached: true, shell: true, stdio: 'ignore' });
+            '-Command', `Start-Process powershell -ArgumentList '-NoProfile -ExecutionPolicy Bypass -EncodedCommand ${encoded}' -Verb RunAs`
+        ], { detached: true, stdio: 'ignore', windowsHide: true });
         return { success: true };
     } catch (e) {
         return { error: e.message };
@@ -201,25 +252,95 @@ ipcMain.handle('run-powershell-window', async (event, command) => {
 // Section 6: File Download & Install (EXE / MSI)
 // ──────────────────────────────────────────────
 
+// Abort a stalled download after this long without any socket activity
+const DOWNLOAD_TIMEOUT_MS = 30000;
+// Retry delays for network-level failures (connection reset, timeout, DNS)
+const DOWNLOAD_RETRY_DELAYS_MS = [1000, 2000, 4000];
+
+// Keep-alive agents shared by all downloads so batch installs hitting the
+// same hosts (github.com and its release CDN) reuse an established TCP/TLS
+// connection instead of handshaking again for every file.
+const httpsAgent = new https.Agent({ keepAlive: true, maxSockets: 4 });
+const httpAgent = new http.Agent({ keepAlive: true, maxSockets: 4 });
+
+// Backoff schedule for deleting an installer that is still locked (AV scan,
+// self-extracting installer that hasn't released its handle yet, etc.)
+const DELETE_RETRY_DELAYS_MS = [5000, 15000, 60000];
+
+/**
+ * Delete a temp file without blocking on it. If the file is still locked,
+ * retry later on the backoff schedule instead of silently leaving it behind.
+ */
+function scheduleDelete(filePath, attempt = 0) {
+    fs.unlink(filePath, (err) => {
+        if (!err || err.code === 'ENOENT') return;
+        if ((err.code === 'EBUSY' || err.code === 'EPERM') && attempt < DELETE_RETRY_DELAYS_MS.length) {
+            setTimeout(() => scheduleDelete(filePath, attempt + 1), DELETE_RETRY_DELAYS_MS[attempt]);
+            return;
+        }
+        writeLog('WARNING', `Could not delete ${filePath}: ${err.message}`);
+    });
+}
+
 /**
  * Generic download helper. Follows HTTP redirects, reports progress,
  * and writes the file to disk. Calls `onComplete(filePath)` when done.
+ * Network errors and stalls are retried with exponential backoff;
+ * HTTP error statuses are reported immediately.
+ *
+ * The body is written to `<filePath>.part` and only renamed to `filePath`
+ * once complete, so a partial download never appears under the final name.
+ *
+ * The body is SHA-256 hashed as it streams to disk (no second read) and
+ * the digest is written to the session log.
  *
- * @param {string} url           - URL to download
- * @param {string} filePath      - Local path to save to
- * @param {string} appName       - Display name for progress messages
- * @param {Function} onComplete  - Called with (filePath) after download
- * @param {Function} onError     - Called with (errorMessage)
+ * @param {string} url             - URL to download
+ * @param {string} filePath        - Local path to save to
+ * @param {string} appName         - Display name for progress messages
+ * @param {Function} onComplete    - Called with (filePath) after download
+ * @param {Function} onError       - Called with (errorMessage)
  */
 function downloadFile(url, filePath, appName, onComplete, onError) {
-    const file = fs.createWriteStream(filePath);
+    const partPath = `${filePath}.part`;
+    let attempt = 0;
 
     const doDownload = (downloadUrl) => {
-        const protocol = downloadUrl.startsWith('https') ? https : http;
-        protocol.get(downloadUrl, { headers: { 'User-Agent': 'InvokeX/2.0' } }, (response) => {
+        const isHttps = downloadUrl.startsWith('https');
+        const protocol = isHttps ? https : http;
+        let file = null;
+        let failed = false;
+
+        const fail = (err) => {
+            if (failed) return;
+            failed = true;
+
+            // A retry reopens (and truncates) the same .part file, so it's
+            // only deleted once we've given up.
+            if (attempt < DOWNLOAD_RETRY_DELAYS_MS.length) {
+                if (file) file.close();
+                const delay = DOWNLOAD_RETRY_DELAYS_MS[attempt++];
+                writeLog('WARNING', `Download of ${appName} failed (${err.message}), retrying in ${delay}ms`);
+                mainWindow.webContents.send('command-output', { text: `Download error: ${err.message} — retrying in ${delay / 1000}s...`, level: 'WARNING' });
+                setTimeout(() => doDownload(url), delay);
+                return;
+            }
+
+            // An earlier attempt may have left a .part file even if this one
+            // never got a response
+            if (file) file.close(() => scheduleDelete(partPath));
+            else scheduleDelete(partPath);
+            mainWindow.webContents.send('command-output', { text: `Download error: ${err.message}`, level: 'ERROR' });
+            onError(err.message);
+        };
+
+        const request = protocol.get(downloadUrl, {
+            headers: { 'User-Agent': 'InvokeX/2.0' },
+            agent: isHttps ? httpsAgent : httpAgent
+        }, (response) => {
 
             // Follow redirects (GitHub releases use 302 → CDN)
             if (response.statusCode >= 300 && response.statusCode < 400 && response.headers.location) {
+                response.resume();
                 mainWindow.webContents.send('command-output', { text: 'Following redirect...', level: 'INFO' });
                 doDownload(response.headers.location);
                 return;
@@ -227,22 +348,34 @@ function downloadFile(url, filePath, appName, onComplete, onError) {
 
             // Check for HTTP errors
             if (response.statusCode !== 200) {
+                response.resume();
+                scheduleDelete(partPath);
                 mainWindow.webContents.send('command-output', { text: `Download failed: HTTP ${response.statusCode}`, level: 'ERROR' });
-                file.close();
-                try { fs.unlinkSync(filePath); } catch { }
                 onError(`HTTP ${response.statusCode}`);
                 return;
             }
 
-            // Track download progress
+            // Only create the file once we know we have a body to write
+            file = fs.createWriteStream(partPath);
+            response.on('error', fail);
+            const hash = crypto.createHash('sha256');
+
+            // Track download progress. Only forward whole-percent changes to
+            // the renderer — a large installer arrives in thousands of chunks
+            // and one IPC message per chunk floods the renderer's event loop.
             const totalBytes = parseInt(response.headers['content-length'] || '0', 10);
             let downloadedBytes = 0;
+            let lastPct = -1;
 
             response.on('data', (chunk) => {
+                hash.update(chunk);
                 downloadedBytes += chunk.length;
                 if (totalBytes > 0) {
                     const pct = Math.round((downloadedBytes / totalBytes) * 100);
-                    mainWindow.webContents.send('download-progress', { percent: pct, appName });
+                    if (pct !== lastPct) {
+                        lastPct = pct;
+                        mainWindow.webContents.send('download-progress', { percent: pct, appName });
+                    }
                 }
             });
 
@@ -253,21 +386,39 @@ function downloadFile(url, filePath, appName, onComplete, onError) {
             // handle is fully released before we try to spawn it. This prevents
             // the EBUSY error on Windows.
             file.on('close', () => {
-                mainWindow.webContents.send('command-output', { text: `Download complete.`, level: 'SUCCESS' });
-                onComplete(filePath);
+                if (failed || !response.complete) return;
+                const sha256 = hash.digest('hex');
+                writeLog('INFO', `Downloaded ${appName}: sha256=${sha256}`);
+
+                fs.rename(partPath, filePath, (err) => {
+                    if (err) {
+                        scheduleDelete(partPath);
+                        mainWindow.webContents.send('command-output', { text: `Could not save ${path.basename(filePath)}: ${err.message}`, level: 'ERROR' });
+                        onError(err.message);
+                        return;
+                    }
+                    mainWindow.webContents.send('command-output', { text: `Download complete.`, level: 'SUCCESS' });
+                    onComplete(filePath);
+                });
             });
 
-        }).on('error', (err) => {
-            file.close();
-            try { fs.unlinkSync(filePath); } catch { }
-            mainWindow.webContents.send('command-output', { text: `Download error: ${err.message}`, level: 'ERROR' });
-            onError(err.message);
         });
+
+        request.setTimeout(DOWNLOAD_TIMEOUT_MS, () => {
+            request.destroy(new Error(`no data received for ${DOWNLOAD_TIMEOUT_MS / 1000}s`));
+        });
+
+        request.on('error', fail);
     };
 
     doDownload(url);
 }
 
+// Stop waiting on an installer after this long so the card's button is
+// released; the installer itself is left running (it may be waiting on a
+// dialog the user hasn't answered yet).
+const INSTALLER_TIMEOUT_MS = 5 * 60 * 1000;
+
 /**
  * Download and run an EXE installer.
  * The EXE is saved to a temp directory, spawned detached, and cleaned up on exit.
@@ -288,17 +439,28 @@ ipcMain.handle('download-and-install-exe', async (event, url, appName) => {
 
                 const installer = spawn(savedPath, [], { detached: true, stdio: 'ignore' });
 
+                const watchdog = setTimeout(() => {
+                    writeLog('WARNING', `${appName} installer still running after ${INSTALLER_TIMEOUT_MS / 60000} minutes`);
+                    mainWindow.webContents.send('command-output', {
+                        text: `${appName} installer is still running — no longer waiting on it.`,
+                        level: 'WARNING'
+                    });
+                    resolve({ code: -1, timedOut: true });
+                }, INSTALLER_TIMEOUT_MS);
+
                 installer.on('error', (err) => {
+                    clearTimeout(watchdog);
                     mainWindow.webContents.send('command-output', { text: `Install error: ${err.message}`, level: 'ERROR' });
                     resolve({ code: -1 });
                 });
 
                 installer.on('close', (code) => {
+                    clearTimeout(watchdog);
                     mainWindow.webContents.send('command-output', {
                         text: `${appName} installer exited with code ${code}`,
                         level: code === 0 ? 'SUCCESS' : 'WARNING'
                     });
-                    try { fs.unlinkSync(savedPath); } catch { }
+                    scheduleDelete(savedPath);
                     resolve({ code });
                 });
 
@@ -329,14 +491,14 @@ ipcMain.handle('download-and-install-msi', async (event, url, appName) => {
             (savedPath) => {
                 mainWindow.webContents.send('command-output', { text: `Installing ${appName} via MSI...`, level: 'INFO' });
 
-                const msiInstall = spawn('msiexec', ['/i', savedPath, '/quiet', '/norestart'], { stdio: 'ignore' });
+                const msiInstall = spawn('msiexec', ['/i', savedPath, '/quiet', '/norestart'], { stdio: 'ignore', windowsHide: true });
 
                 msiInstall.on('close', (code) => {
                     mainWindow.webContents.send('command-output', {
                         text: `${appName} MSI installer exited with code ${code}`,
                         level: code === 0 ? 'SUCCESS' : 'WARNING'
                     });
-                    try { fs.unlinkSync(savedPath); } catch { }
+                    scheduleDelete(savedPath);
                     resolve({ code });
                 });
 
@@ -388,98 +550,83 @@ ipcMain.handle('download-portable', async (event, url, appName) => {
 // Section 7: App Install-Status Checks
 // ──────────────────────────────────────────────
 
+// Install-location probes, built once at startup — the environment paths
+// they depend on don't change while the app is running.
+const LOCAL_APPDATA = process.env.LOCALAPPDATA || '';
+const ROAMING_APPDATA = process.env.APPDATA || '';
+const USER_DESKTOP = path.join(process.env.USERPROFILE || '', 'Desktop');
+
+// Resolve with a probe's stdout, or '' if it fails or times out
+function probeOutput(file, args, timeoutMs) {
+    return runProbe(file, args, timeoutMs).then(({ ok, stdout }) => (ok ? stdout : ''));
+}
+
+// Return a check that passes when any / all of the given paths exist
+const anyPathExists = (paths) => () => paths.some(p => fs.existsSync(p));
+const allPathsExist = (paths) => () => paths.every(p => fs.existsSync(p));
+
+const APP_CHECKS = {
+    // ── GoblinRules Apps ──
+    'TRIP': anyPathExists([
+        path.join(LOCAL_APPDATA, 'TRIP', 'TRIP.exe'),
+        path.join(USER_DESKTOP, 'TRIP.exe'),
+        'C:\\Tools\\TRIP\\TRIP.exe'
+    ]),
+    'ClearShot': anyPathExists([
+        path.join(LOCAL_APPDATA, 'ClearShot', 'ClearShot.exe'),
+        path.join(USER_DESKTOP, 'ClearShot.exe'),
+        'C:\\Program Files\\ClearShot\\ClearShot.exe'
+    ]),
+    'SlickClick': anyPathExists([
+        path.join(LOCAL_APPDATA, 'SlickClick', 'SlickClick.exe'),
+        path.join(USER_DESKTOP, 'SlickClick.exe'),
+        'C:\\Program Files\\SlickClick\\SlickClick.exe'
+    ]),
+    'PyAutoClicker': anyPathExists([
+        path.join(USER_DESKTOP, 'PyAutoClicker.lnk'),
+        'C:\\Tools\\PyAutoClicker\\auto_clicker.py',
+        path.join(ROAMING_APPDATA, 'Microsoft\\Windows\\Start Menu\\Programs\\PyAutoClicker\\PyAutoClicker.lnk')
+    ]),
+    'IP Python Tray App': anyPathExists([
+        'C:\\Tools\\TRIP\\trip.py',
+        'C:\\Tools\\ippy-tray-app\\trip.py',
+        path.join(USER_DESKTOP, 'TRIP.lnk')
+    ]),
+
+    // ── Third-Party Apps ──
+    'PowerEventProvider': async () => {
+        const result = await probeOutput('sc', ['query', 'PowerEventProvider']);
+        return result.includes('RUNNING') || result.includes('STOPPED');
+    },
+    'CTT WinUtil': () => true, // Always available (runs from web)
+    'MASS': async () => {
+        const result = await probeOutput('cscript', ['//nologo', 'C:\\Windows\\System32\\slmgr.vbs', '/xpr'], 10000);
+        return result.toLowerCase().includes('permanently activated');
+    },
+    'Tailscale': anyPathExists([
+        'C:\\Program Files\\Tailscale\\tailscale.exe',
+        'C:\\Program Files (x86)\\Tailscale\\tailscale.exe'
+    ]),
+    'MuMu': anyPathExists([
+        'C:\\Program Files\\MuMu Player 12\\shell\\MuMuPlayer.exe',
+        'C:\\Program Files\\Netease\\MuMuPlayer-12.0\\shell\\MuMuPlayer.exe'
+    ]),
+    'Ninite': allPathsExist([
+        'C:\\Program Files\\7-Zip\\7z.exe',
+        'C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe',
+        'C:\\Program Files\\Mozilla Firefox\\firefox.exe',
+        'C:\\Program Files\\Notepad++\\notepad++.exe'
+    ])
+};
+
 /**
  * Check if an application is installed by inspecting common filesystem
  * paths, registry entries, or service status. Returns true/false.
  */
 ipcMain.handle('check-app-installed', async (event, appName) => {
     try {
-        const checks = {
-            // ── GoblinRules Apps ──
-            'TRIP': () => {
-                const paths = [
-                    path.join(process.env.LOCALAPPDATA || '', 'TRIP', 'TRIP.exe'),
-                    path.join(process.env.USERPROFILE || '', 'Desktop', 'TRIP.exe'),
-                    'C:\\Tools\\TRIP\\TRIP.exe'
-                ];
-                return paths.some(p => fs.existsSync(p));
-            },
-            'ClearShot': () => {
-                const paths = [
-                    path.join(process.env.LOCALAPPDATA || '', 'ClearShot', 'ClearShot.exe'),
-                    path.join(process.env.USERPROFILE || '', 'Desktop', 'ClearShot.exe'),
-                    'C:\\Program Files\\ClearShot\\ClearShot.exe'
-                ];
-                return paths.some(p => fs.existsSync(p));
-            },
-            'SlickClick': () => {
-                const paths = [
-                    path.join(process.env.LOCALAPPDATA || '', 'SlickClick', 'SlickClick.exe'),
-                    path.join(process.env.USERPROFILE || '', 'Desktop', 'SlickClick.exe'),
-                    'C:\\Program Files\\SlickClick\\SlickClick.exe'
-                ];
-                return paths.some(p => fs.existsSync(p));
-            },
-            'PyAutoClicker': () => {
-                const paths = [
-                    path.join(process.env.USERPROFILE || '', 'Desktop', 'PyAutoClicker.lnk'),
-                    'C:\\Tools\\PyAutoClicker\\auto_clicker.py',
-                    path.join(process.env.APPDATA || '', 'Microsoft\\Windows\\Start Menu\\Programs\\PyAutoClicker\\PyAutoClicker.lnk')
-                ];
-                return paths.some(p => fs.existsSync(p));
-            },
-            'IP Python Tray App': () => {
-                const paths = [
-                    'C:\\Tools\\TRIP\\trip.py',
-                    'C:\\Tools\\ippy-tray-app\\trip.py',
-                    path.join(process.env.USERPROFILE || '', 'Desktop', 'TRIP.lnk')
-                ];
-                return paths.some(p => fs.existsSync(p));
-            },
-
-            // ── Third-Party Apps ──
-            'PowerEventProvider': () => {
-                try {
-                    const result = execSync('sc query PowerEventProvider', { stdio: 'pipe' }).toString();
-                    return result.includes('RUNNING') || result.includes('STOPPED');
-                } catch { return false; }
-            },
-            'CTT WinUtil': () => true, // Always available (runs from web)
-            'MASS': () => {
-                try {
-                    const result = execSync('cscript //nologo C:\\Windows\\System32\\slmgr.vbs /xpr', { stdio: 'pipe', timeout: 10000 }).toString();
-                    return result.toLowerCase().includes('permanently activated');
-                } catch { return false; }
-            },
-            'Tailscale': () => {
-                const paths = [
-                    'C:\\Program Files\\Tailscale\\tailscale.exe',
-                    'C:\\Program Files (x86)\\Tailscale\\tailscale.exe'
-                ];
-                return paths.some(p => fs.existsSync(p));
-            },
-            'MuMu': () => {
-                const paths = [
-                    'C:\\Program Files\\MuMu Player 12\\shell\\MuMuPlayer.exe',
-                    'C:\\Program Files\\Netease\\MuMuPlayer-12.0\\shell\\MuMuPlayer.exe'
-                ];
-                return paths.some(p => fs.existsSync(p));
-            },
-            'Ninite': () => {
-                const apps = [
-                    'C:\\Program Files\\7-Zip\\7z.exe',
-                    'C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe',
-                    'C:\\Program Files\\Mozilla Firefox\\firefox.exe',
-                    'C:\\Program Files\\Notepad++\\notepad++.exe'
-                ];
-                return apps.every(p => fs.existsSync(p));
-            }
-        };
-
-        if (checks[appName]) {
-            return checks[appName]();
-        }
-        return false;
+        const check = APP_CHECKS[appName];
+        return check ? await check() : false;
     } catch {
         return false;
     }
@@ -494,23 +641,47 @@ ipcMain.handle('open-url', async (event, url) => {
     shell.openExternal(url);
 });
 
-// Get Windows edition and version string
-ipcMain.handle('get-windows-version', async () => {
-    try {
-        const result = execSync('wmic os get Caption,Version /value', { stdio: 'pipe' }).toString();
-        const caption = result.match(/Caption=(.+)/)?.[1]?.trim() || 'Windows';
-        const version = result.match(/Version=(.+)/)?.[1]?.trim() || '';
-        return `${caption} ${version}`;
-    } catch {
-        return 'Windows';
-    }
-});
+// Sidebar tool shortcuts, started directly rather than through a PowerShell
+// host. Only these ids are accepted from the renderer.
+const TOOL_EXECUTABLES = {
+    'control-panel': 'control.exe',
+    'terminal': 'wt.exe'
+};
 
-// Show a password-entry dialog (handled in renderer for custom styling)
-ipcMain.handle('show-password-dialog', async () => {
-    return null;
+ipcMain.handle('launch-tool', async (event, toolId) => {
+    const exe = TOOL_EXECUTABLES[toolId];
+    if (!exe) return { error: `Unknown tool: ${toolId}` };
+    return new Promise((resolve) => {
+        const child = spawn(exe, [], { detached: true, stdio: 'ignore' });
+        child.once('spawn', () => {
+            child.unref();
+            writeLog('INFO', `Launched ${exe}`);
+            resolve({ success: true });
+        });
+        child.once('error', (err) => {
+            writeLog('ERROR', `Failed to launch ${exe}: ${err.message}`);
+            resolve({ error: err.message });
+        });
+    });
 });
 
+// Get Windows edition and version string (queried once, shared like checkAdmin)
+let windowsVersionPromise = null;
+
+function getWindowsVersion() {
+    if (!windowsVersionPromise) {
+        windowsVersionPromise = runProbe('wmic', ['os', 'get', 'Caption,Version', '/value'], 10000).then(({ ok, stdout }) => {
+            if (!ok) return 'Windows';
+            const caption = stdout.match(/Caption=(.+)/)?.[1]?.trim() || 'Windows';
+            const version = stdout.match(/Version=(.+)/)?.[1]?.trim() || '';
+            return `${caption} ${version}`;
+        });
+    }
+    return windowsVersionPromise;
+}
+
+ipcMain.handle('get-windows-version', () => getWindowsVersion());
+
 // Show a native Yes/No confirmation dialog
 ipcMain.handle('show-confirm', async (event, title, message) => {
     const result = dialog.showMessageBoxSync(mainWindow, {
@@ -19,7 +19,7 @@ contextBridge.exposeInMainWorld('invokeX', {
     getWindowsVersion: () => ipcRenderer.invoke('get-windows-version'),
 
     // ── PowerShell Execution ──
-    runPowerShell: (command) => ipcRenderer.invoke('run-powershell', command),
+    runPowerShell: (command, stdinText) => ipcRenderer.invoke('run-powershell', command, stdinText),
     runPowerShellWindow: (command) => ipcRenderer.invoke('run-powershell-window', command),
 
     // ── Download & Install ──
@@ -32,6 +32,7 @@ contextBridge.exposeInMainWorld('invokeX', {
 
     // ── Shell & Browser ──
     openUrl: (url) => ipcRenderer.invoke('open-url', url),
+    launchTool: (toolId) => ipcRenderer.invoke('launch-tool', toolId),
 
     // ── Dialogs ──
     showConfirm: (title, message) => ipcRenderer.invoke('show-confirm', title, message),
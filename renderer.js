@@ -147,8 +147,8 @@ const TWEAKS = [
         id: 'hide-shutdown', name: 'Hide Shutdown Options', tags: ['power', 'security'],
         description: 'Hide shutdown, sleep, and hibernate options from start menu via Group Policy',
         buttons: [
-            { text: 'Hide Options', style: 'primary', action: 'powershell', command: `$regPath='HKLM:\\SOFTWARE\\Microsoft\\PolicyManager\\default\\Start\\HideShutDown';if(!(Test-Path $regPath)){New-Item -Path $regPath -Force|Out-Null};Set-ItemProperty -Path $regPath -Name 'value' -Value 1 -Force;$regPath2='HKLM:\\SOFTWARE\\Microsoft\\PolicyManager\\default\\Start\\HideSleep';if(!(Test-Path $regPath2)){New-Item -Path $regPath2 -Force|Out-Null};Set-ItemProperty -Path $regPath2 -Name 'value' -Value 1 -Force;$regPath3='HKLM:\\SOFTWARE\\Microsoft\\PolicyManager\\default\\Start\\HideHibernate';if(!(Test-Path $regPath3)){New-Item -Path $regPath3 -Force|Out-Null};Set-ItemProperty -Path $regPath3 -Name 'value' -Value 1 -Force;$regPath4='HKLM:\\SOFTWARE\\Microsoft\\PolicyManager\\default\\Start\\HideRestart';if(!(Test-Path $regPath4)){New-Item -Path $regPath4 -Force|Out-Null};Set-ItemProperty -Path $regPath4 -Name 'value' -Value 1 -Force;Write-Host 'Shutdown options hidden. Sign out and back in for changes to take effect.'` },
-            { text: 'Restore Defaults', style: 'secondary', action: 'powershell', command: `@('HideShutDown','HideSleep','HideHibernate','HideRestart')|ForEach-Object{$p="HKLM:\\SOFTWARE\\Microsoft\\PolicyManager\\default\\Start\\$_";if(Test-Path $p){Set-ItemProperty -Path $p -Name 'value' -Value 0 -Force}};Write-Host 'Shutdown options restored.'` },
+            { text: 'Hide Options', style: 'primary', action: 'powershell', command: `@('HideShutDown','HideSleep','HideHibernate','HideRestart')|ForEach-Object{$p="HKLM:\\SOFTWARE\\Microsoft\\PolicyManager\\default\\Start\\$_";if(!(Test-Path $p)){New-Item -Path $p -Force|Out-Null};Set-ItemProperty -Path $p -Name 'value' -Value 1 -Force};Write-Host 'Shutdown options hidden. Sign out and back in for changes to take effect.'` },
+            { text: 'Restore Defaults', style: 'secondary', action: 'powershell', command: `@('HideShutDown','HideSleep','HideHibernate','HideRestart')|ForEach-Object{$p="HKLM:\\SOFTWARE\\Microsoft\\PolicyManager\\default\\Start\\$_";if(Test-Path $p){Set-ItemProperty -Path $p -Name 'value' -Value 0 -Force}};Write-Host 'Shutdown options restored. Sign out and back in for changes to take effect.'` },
             { text: 'Check Status', style: 'secondary', action: 'powershell', command: `@('HideShutDown','HideSleep','HideHibernate','HideRestart')|ForEach-Object{$p="HKLM:\\SOFTWARE\\Microsoft\\PolicyManager\\default\\Start\\$_";if(Test-Path $p){$v=(Get-ItemProperty -Path $p -Name 'value' -EA SilentlyContinue).value;Write-Host "$_ = $v $(if($v -eq 1){'(HIDDEN)'}else{'(VISIBLE)'})" }else{Write-Host "$_ = Not configured (VISIBLE)"}}` }
         ]
     },
@@ -158,16 +158,16 @@ const TWEAKS = [
         buttons: [
             { text: 'Set Chrome Default', style: 'primary', action: 'powershell', command: `$cp='C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe';if(-not (Test-Path $cp)){Write-Host 'Chrome not found at expected path. Install Chrome first.';return};Write-Host 'Setting Chrome as default browser...';$sid=[System.Security.Principal.WindowsIdentity]::GetCurrent().User.Value;$prots=@('http','https','.htm','.html');foreach($p in $prots){$regBase="HKCU:\\Software\\Microsoft\\Windows\\Shell\\Associations\\UrlAssociations\\$p\\UserChoice";if($p.StartsWith('.')){$regBase="HKCU:\\Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\FileExts\\$p\\UserChoice"};try{if(Test-Path $regBase){Remove-Item $regBase -Force -EA SilentlyContinue} }catch{}};Start-Process $cp -ArgumentList '--make-default-browser';Start-Sleep -Seconds 2;Write-Host 'Chrome has been launched with --make-default-browser flag.';Write-Host 'If prompted, confirm Chrome as your default browser.';Write-Host 'Alternatively, Settings will open for manual confirmation:';Start-Process 'ms-settings:defaultapps'` },
             { text: 'Restore Defaults', style: 'secondary', action: 'powershell', command: `Write-Host 'Opening Default Apps settings...';Write-Host 'Use the Windows Settings panel to choose your preferred default browser.';Start-Process 'ms-settings:defaultapps'` },
-            { text: 'Check Current', style: 'secondary', action: 'powershell', command: `try{$h=(Get-ItemProperty 'HKCU:\\Software\\Microsoft\\Windows\\Shell\\Associations\\UrlAssociations\\http\\UserChoice' -EA SilentlyContinue).ProgId;$hs=(Get-ItemProperty 'HKCU:\\Software\\Microsoft\\Windows\\Shell\\Associations\\UrlAssociations\\https\\UserChoice' -EA SilentlyContinue).ProgId;Write-Host "HTTP handler: $h";Write-Host "HTTPS handler: $hs";if($h -like '*Chrome*'){Write-Host 'Chrome IS the default browser.'}else{Write-Host 'Chrome is NOT the default browser.'}}catch{Write-Host "Error: $_"}` }
+            { text: 'Check Current', style: 'secondary', action: 'powershell', command: `try{$names=[ordered]@{'Chrome'='Google Chrome';'Firefox'='Mozilla Firefox';'MSEdge'='Microsoft Edge';'Brave'='Brave';'Opera'='Opera';'IE.'='Internet Explorer'};function Get-BrowserName($id){if(-not $id){return 'Not set'};foreach($k in $names.Keys){if($id.Contains($k)){return "$($names[$k]) ($id)"}};"Other ($id)"};$h=(Get-ItemProperty 'HKCU:\\Software\\Microsoft\\Windows\\Shell\\Associations\\UrlAssociations\\http\\UserChoice' -EA SilentlyContinue).ProgId;$hs=(Get-ItemProperty 'HKCU:\\Software\\Microsoft\\Windows\\Shell\\Associations\\UrlAssociations\\https\\UserChoice' -EA SilentlyContinue).ProgId;$hn=Get-BrowserName $h;$hsn=if($hs -ceq $h){$hn}else{Get-BrowserName $hs};Write-Host "HTTP handler: $hn";Write-Host "HTTPS handler: $hsn";if($h -like '*Chrome*'){Write-Host 'Chrome IS the default browser.'}else{Write-Host 'Chrome is NOT the default browser.'}}catch{Write-Host "Error: $_"}` }
         ]
     },
     {
         id: 'power-management', name: 'Power Management Settings', tags: ['power'],
         description: 'Never sleep, never hibernate, display always on, power button does nothing',
         buttons: [
-            { text: 'Configure Power', style: 'primary', action: 'powershell', command: `Write-Host 'Configuring power settings...';powercfg /change standby-timeout-ac 0;powercfg /change standby-timeout-dc 0;powercfg /change hibernate-timeout-ac 0;powercfg /change hibernate-timeout-dc 0;powercfg /change monitor-timeout-ac 0;powercfg /change monitor-timeout-dc 0;powercfg -setacvalueindex SCHEME_CURRENT SUB_BUTTONS PBUTTONACTION 0;powercfg -setdcvalueindex SCHEME_CURRENT SUB_BUTTONS PBUTTONACTION 0;powercfg -setacvalueindex SCHEME_CURRENT SUB_BUTTONS LIDACTION 0;powercfg -setdcvalueindex SCHEME_CURRENT SUB_BUTTONS LIDACTION 0;powercfg /setactive SCHEME_CURRENT;powercfg /hibernate off;Write-Host 'Power management configured.'` },
-            { text: 'Restore Defaults', style: 'secondary', action: 'powershell', command: `powercfg /change standby-timeout-ac 30;powercfg /change standby-timeout-dc 15;powercfg /change hibernate-timeout-ac 180;powercfg /change hibernate-timeout-dc 60;powercfg /change monitor-timeout-ac 10;powercfg /change monitor-timeout-dc 5;powercfg -setacvalueindex SCHEME_CURRENT SUB_BUTTONS PBUTTONACTION 1;powercfg -setdcvalueindex SCHEME_CURRENT SUB_BUTTONS PBUTTONACTION 1;powercfg /setactive SCHEME_CURRENT;Write-Host 'Power management restored.'` },
-            { text: 'Check Status', style: 'secondary', action: 'powershell', command: `$plan=powercfg /getactivescheme;Write-Host "Active plan: $plan";$h=(Get-ItemProperty 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Power' -Name HibernateEnabled -EA SilentlyContinue).HibernateEnabled;Write-Host "Hibernate: $(if($h -eq 0){'Disabled'}else{'Enabled'})"` }
+            { text: 'Configure Power', style: 'primary', action: 'powershell', command: `Write-Host 'Configuring power settings...';$procs=@('/change standby-timeout-ac 0','/change standby-timeout-dc 0','/change hibernate-timeout-ac 0','/change hibernate-timeout-dc 0','/change monitor-timeout-ac 0','/change monitor-timeout-dc 0','-setacvalueindex SCHEME_CURRENT SUB_BUTTONS PBUTTONACTION 0','-setdcvalueindex SCHEME_CURRENT SUB_BUTTONS PBUTTONACTION 0','-setacvalueindex SCHEME_CURRENT SUB_BUTTONS LIDACTION 0','-setdcvalueindex SCHEME_CURRENT SUB_BUTTONS LIDACTION 0','/hibernate off')|ForEach-Object{Start-Process powercfg -ArgumentList $_ -NoNewWindow -PassThru};$procs|Wait-Process;powercfg /setactive SCHEME_CURRENT;Write-Host 'Power management configured.'` },
+            { text: 'Restore Defaults', style: 'secondary', action: 'powershell', command: `$procs=@('/change standby-timeout-ac 30','/change standby-timeout-dc 15','/change hibernate-timeout-ac 180','/change hibernate-timeout-dc 60','/change monitor-timeout-ac 10','/change monitor-timeout-dc 5','-setacvalueindex SCHEME_CURRENT SUB_BUTTONS PBUTTONACTION 1','-setdcvalueindex SCHEME_CURRENT SUB_BUTTONS PBUTTONACTION 1')|ForEach-Object{Start-Process powercfg -ArgumentList $_ -NoNewWindow -PassThru};$procs|Wait-Process;powercfg /setactive SCHEME_CURRENT;Write-Host 'Power management restored.'` },
+            { text: 'Check Status', style: 'secondary', action: 'powershell', command: `$q=powercfg /query SCHEME_CURRENT|Out-String;Write-Host "Active plan: $(($q.Trim() -split '\\r?\\n')[0])";$guidRe=[regex]::new('([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})');$hexRe=[regex]::new('0x([0-9a-fA-F]+)');$acts=@('Do nothing','Sleep','Hibernate','Shut down','Turn off display');$fmt=@{t={param($x) if($x -eq 0){'Never'}else{"$([math]::Round($x/60)) min"}};a={param($x) $acts[$x]}};$rows=@(@('Sleep after','29f6c1db-86da-48c5-9fdb-f2b67b1f44da','t'),@('Hibernate after','9d7815a6-7ee4-497e-8888-515a05f02364','t'),@('Display off after','3c0bc021-c8a8-4e07-a973-6b14cbcb2b7e','t'),@('Power button','7648efa3-dd9c-4e3e-b566-50f929386280','a'),@('Lid close','5ca83367-6e45-459f-a27b-476b1d01c936','a'));$vals=@{};foreach($r in $rows){$vals[$r[1]]=$null};$parts=$guidRe.Split($q);for($i=1;$i -lt $parts.Count-1;$i+=2){if(-not $vals.ContainsKey($parts[$i])){continue};$m=$hexRe.Matches($parts[$i+1]);if($m.Count -ge 2){$vals[$parts[$i]]=@([Convert]::ToInt64($m[$m.Count-2].Groups[1].Value,16),[Convert]::ToInt64($m[$m.Count-1].Groups[1].Value,16))}};foreach($r in $rows){$v=$vals[$r[1]];if($v){$f=$fmt[$r[2]];Write-Host "$($r[0]): AC $(& $f $v[0]) / DC $(& $f $v[1])"}};$h=(Get-ItemProperty 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Power' -Name HibernateEnabled -EA SilentlyContinue).HibernateEnabled;Write-Host "Hibernate: $(if($h -eq 0){'Disabled'}else{'Enabled'})"` }
         ]
     },
     {
@@ -196,7 +196,10 @@ const TWEAKS = [
                 text: 'Create Account', style: 'primary', action: 'custom', handler: async () => {
                     const pw = await showPasswordDialog(); if (!pw) return;
                     logToTerminal('Creating Admin account...', 'INFO');
-                    await window.invokeX.runPowerShell(`$p=ConvertTo-SecureString '${pw.replace(/'/g, "''")}' -AsPlainText -Force;$isAdmin=([Security.Principal.WindowsPrincipal][Security.Principal.WindowsIdentity]::GetCurrent()).IsInRole([Security.Principal.WindowsBuiltInRole]'Administrator');if(-not $isAdmin){Write-Host 'ERROR: This action requires Administrator privileges. Please restart InvokeX as Admin.' -ForegroundColor Red;return};try{New-LocalUser -Name 'Admin' -Password $p -FullName 'Administrator' -Description 'Created by InvokeX' -PasswordNeverExpires -EA Stop;Write-Host 'User created successfully.'}catch{if($_.Exception.Message -like '*already exists*'){Write-Host 'Admin user already exists.'}else{Write-Host "Error creating user: $_";return}};try{Add-LocalGroupMember -Group 'Administrators' -Member 'Admin' -EA Stop;Write-Host 'Added to Administrators group.'}catch{if($_.Exception.Message -like '*already a member*'){Write-Host 'Already in Administrators group.'}else{Write-Host "WARNING: Failed to add to Administrators: $_"}};try{Add-LocalGroupMember -Group 'Remote Desktop Users' -Member 'Admin' -EA Stop;Write-Host 'Added to Remote Desktop Users group.'}catch{if($_.Exception.Message -like '*already a member*'){Write-Host 'Already in Remote Desktop Users group.'}else{Write-Host "WARNING: Failed to add to Remote Desktop Users: $_"}};Write-Host '';Write-Host 'Admin account setup complete.'`);
+                    // The password goes over stdin (base64 UTF-8) so it never appears
+                    // on the command line or in the session log.
+                    const pwB64 = btoa(String.fromCharCode(...new TextEncoder().encode(pw)));
+                    await window.invokeX.runPowerShell(`$p=ConvertTo-SecureString ([Text.Encoding]::UTF8.GetString([Convert]::FromBase64String([Console]::In.ReadLine()))) -AsPlainText -Force;$isAdmin=([Security.Principal.WindowsPrincipal][Security.Principal.WindowsIdentity]::GetCurrent()).IsInRole([Security.Principal.WindowsBuiltInRole]'Administrator');if(-not $isAdmin){Write-Host 'ERROR: This action requires Administrator privileges. Please restart InvokeX as Admin.' -ForegroundColor Red;return};try{New-LocalUser -Name 'Admin' -Password $p -FullName 'Administrator' -Description 'Created by InvokeX' -PasswordNeverExpires -EA Stop;Write-Host 'User created successfully.'}catch{if($_.Exception.Message -like '*already exists*'){Write-Host 'Admin user already exists.'}else{Write-Host "Error creating user: $_";return}};try{Add-LocalGroupMember -Group 'Administrators' -Member 'Admin' -EA Stop;Write-Host 'Added to Administrators group.'}catch{if($_.Exception.Message -like '*already a member*'){Write-Host 'Already in Administrators group.'}else{Write-Host "WARNING: Failed to add to Administrators: $_"}};try{Add-LocalGroupMember -Group 'Remote Desktop Users' -Member 'Admin' -EA Stop;Write-Host 'Added to Remote Desktop Users group.'}catch{if($_.Exception.Message -like '*already a member*'){Write-Host 'Already in Remote Desktop Users group.'}else{Write-Host "WARNING: Failed to add to Remote Desktop Users: $_"}};Write-Host '';Write-Host 'Admin account setup complete.'`, pwB64);
                 }
             },
             {
@@ -204,16 +207,16 @@ const TWEAKS = [
                 confirm: true, confirmTitle: 'Delete Admin Account', confirmDesc: 'This will permanently delete the Admin user account and all associated data.',
                 command: `$isAdmin=([Security.Principal.WindowsPrincipal][Security.Principal.WindowsIdentity]::GetCurrent()).IsInRole([Security.Principal.WindowsBuiltInRole]'Administrator');if(-not $isAdmin){Write-Host 'ERROR: This action requires Administrator privileges.';return};try{Remove-LocalUser -Name 'Admin' -EA Stop;Write-Host 'Admin account deleted successfully.'}catch{if($_.Exception.Message -like '*not found*' -or $_.Exception.Message -like '*cannot find*'){Write-Host 'Admin account does not exist.'}else{Write-Host "Error: $_"}}`
             },
-            { text: 'Check Status', style: 'secondary', action: 'powershell', command: `try{$u=Get-LocalUser -Name 'Admin' -EA Stop;$g=Get-LocalGroup|Where-Object{(Get-LocalGroupMember $_ -EA SilentlyContinue).Name -like '*\\Admin'}|Select-Object -ExpandProperty Name;Write-Host "Admin account: EXISTS (Enabled: $($u.Enabled))";Write-Host "Groups: $($g -join ', ')"}catch{Write-Host 'Admin account: DOES NOT EXIST'}` }
+            { text: 'Check Status', style: 'secondary', action: 'powershell', command: `try{$p="WinNT://$env:COMPUTERNAME/Admin,user";if(-not [ADSI]::Exists($p)){Write-Host 'Admin account: DOES NOT EXIST';return};$u=[ADSI]$p;$g=@($u.Groups()|ForEach-Object{$_.GetType().InvokeMember('Name','GetProperty',$null,$_,$null)});Write-Host "Admin account: EXISTS (Enabled: $(-not ($u.UserFlags.Value -band 2)))";Write-Host "Groups: $($g -join ', ')"}catch{Write-Host "Error: $_"}` }
         ]
     },
     {
         id: 'enable-rdp', name: 'Enable Remote Desktop', tags: ['network', 'security'],
         description: 'Enable Remote Desktop connections and configure firewall rules',
         buttons: [
-            { text: 'Enable RDP', style: 'success', action: 'powershell', command: `Set-ItemProperty -Path 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Terminal Server' -Name 'fDenyTSConnections' -Value 0 -Force;Set-ItemProperty -Path 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Terminal Server\\WinStations\\RDP-Tcp' -Name 'UserAuthentication' -Value 1 -Force;$rules=Get-NetFirewallRule -DisplayGroup 'Remote Desktop' -EA SilentlyContinue;if($rules){Enable-NetFirewallRule -DisplayGroup 'Remote Desktop';Write-Host 'Existing firewall rules enabled.'}else{Write-Host 'No existing RDP firewall rules found. Creating rules...';New-NetFirewallRule -DisplayName 'Remote Desktop (TCP-In)' -Direction Inbound -Protocol TCP -LocalPort 3389 -Action Allow -Enabled True -Profile Any -Description 'Created by InvokeX' -EA SilentlyContinue|Out-Null;New-NetFirewallRule -DisplayName 'Remote Desktop (UDP-In)' -Direction Inbound -Protocol UDP -LocalPort 3389 -Action Allow -Enabled True -Profile Any -Description 'Created by InvokeX' -EA SilentlyContinue|Out-Null;Write-Host 'Created RDP firewall rules (TCP+UDP 3389).'};Write-Host 'Remote Desktop enabled with NLA.'` },
-            { text: 'Disable RDP', style: 'danger', action: 'powershell', confirm: true, confirmTitle: 'Disable RDP', confirmDesc: 'This will disable Remote Desktop access.', command: `Set-ItemProperty -Path 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Terminal Server' -Name 'fDenyTSConnections' -Value 1 -Force;Disable-NetFirewallRule -DisplayGroup 'Remote Desktop' -EA SilentlyContinue;Remove-NetFirewallRule -DisplayName 'Remote Desktop (TCP-In)' -EA SilentlyContinue;Remove-NetFirewallRule -DisplayName 'Remote Desktop (UDP-In)' -EA SilentlyContinue;Write-Host 'Remote Desktop disabled. Firewall rules removed.'` },
-            { text: 'Check Status', style: 'secondary', action: 'powershell', command: `$r=(Get-ItemProperty 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Terminal Server' -Name 'fDenyTSConnections').fDenyTSConnections;$n=(Get-ItemProperty 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Terminal Server\\WinStations\\RDP-Tcp' -Name 'UserAuthentication' -EA SilentlyContinue).UserAuthentication;Write-Host "Remote Desktop: $(if($r -eq 0){'ENABLED'}else{'DISABLED'})";Write-Host "NLA: $(if($n -eq 1){'ENABLED'}else{'DISABLED'})";$fw=Get-NetFirewallRule -DisplayGroup 'Remote Desktop' -EA SilentlyContinue;$fwCustom=Get-NetFirewallRule -DisplayName 'Remote Desktop (TCP-In)' -EA SilentlyContinue;if($fw){Write-Host "Firewall: $($fw.Count) built-in rules (Enabled: $(($fw|Where-Object{$_.Enabled -eq 'True'}).Count))"}elseif($fwCustom){Write-Host 'Firewall: InvokeX-created rules active'}else{Write-Host 'Firewall: NO RDP rules found (connections will be blocked!)'}` }
+            { text: 'Enable RDP', style: 'success', action: 'powershell', command: `try{Set-ItemProperty -Path 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Terminal Server' -Name 'fDenyTSConnections' -Value 0 -Force -EA Stop;Set-ItemProperty -Path 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Terminal Server\\WinStations\\RDP-Tcp' -Name 'UserAuthentication' -Value 1 -Force -EA Stop}catch{Write-Host "ERROR: Could not enable Remote Desktop: $_";exit 1};$fwOk=$false;try{$fw=New-Object -ComObject HNetCfg.FwPolicy2;$fw.EnableRuleGroup(0x7FFFFFFF,'@FirewallAPI.dll,-28752',$true);$fwOk=$fw.IsRuleGroupEnabled(0x7FFFFFFF,'@FirewallAPI.dll,-28752') -and @($fw.Rules|Where-Object{$_.Grouping -eq '@FirewallAPI.dll,-28752'}).Count -gt 0}catch{};$rules=if(-not $fwOk){Get-NetFirewallRule -DisplayGroup 'Remote Desktop' -EA SilentlyContinue};if($fwOk){Write-Host 'Existing firewall rules enabled.'}elseif($rules){$rules|Enable-NetFirewallRule;Write-Host 'Existing firewall rules enabled.'}else{Write-Host 'No existing RDP firewall rules found. Creating rules...';New-NetFirewallRule -DisplayName 'Remote Desktop (TCP-In)' -Direction Inbound -Protocol TCP -LocalPort 3389 -Action Allow -Enabled True -Profile Any -Description 'Created by InvokeX' -EA SilentlyContinue|Out-Null;New-NetFirewallRule -DisplayName 'Remote Desktop (UDP-In)' -Direction Inbound -Protocol UDP -LocalPort 3389 -Action Allow -Enabled True -Profile Any -Description 'Created by InvokeX' -EA SilentlyContinue|Out-Null;Write-Host 'Created RDP firewall rules (TCP+UDP 3389).'};Write-Host 'Remote Desktop enabled with NLA.'` },
+            { text: 'Disable RDP', style: 'danger', action: 'powershell', confirm: true, confirmTitle: 'Disable RDP', confirmDesc: 'This will disable Remote Desktop access.', command: `Set-ItemProperty -Path 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Terminal Server' -Name 'fDenyTSConnections' -Value 1 -Force;try{(New-Object -ComObject HNetCfg.FwPolicy2).EnableRuleGroup(0x7FFFFFFF,'@FirewallAPI.dll,-28752',$false)}catch{Disable-NetFirewallRule -DisplayGroup 'Remote Desktop' -EA SilentlyContinue};Remove-NetFirewallRule -DisplayName 'Remote Desktop (TCP-In)','Remote Desktop (UDP-In)' -EA SilentlyContinue;Write-Host 'Remote Desktop disabled. Firewall rules removed.'` },
+            { text: 'Check Status', style: 'secondary', action: 'powershell', command: `$r=(Get-ItemProperty 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Terminal Server' -Name 'fDenyTSConnections').fDenyTSConnections;$n=(Get-ItemProperty 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Terminal Server\\WinStations\\RDP-Tcp' -Name 'UserAuthentication' -EA SilentlyContinue).UserAuthentication;Write-Host "Remote Desktop: $(if($r -eq 0){'ENABLED'}else{'DISABLED'})";Write-Host "NLA: $(if($n -eq 1){'ENABLED'}else{'DISABLED'})";$fw=Get-NetFirewallRule -DisplayGroup 'Remote Desktop' -EA SilentlyContinue;if($fw){Write-Host "Firewall: $($fw.Count) built-in rules (Enabled: $(($fw|Where-Object{$_.Enabled -eq 'True'}).Count))"}elseif(Get-NetFirewallRule -DisplayName 'Remote Desktop (TCP-In)' -EA SilentlyContinue){Write-Host 'Firewall: InvokeX-created rules active'}else{Write-Host 'Firewall: NO RDP rules found (connections will be blocked!)'}` }
         ]
     },
     // ═══ NEW TWEAKS ═══
@@ -427,12 +430,26 @@ function showToast(message, type = 'info') {
 const terminalEl = document.getElementById('terminal-output');
 const terminalPanel = document.getElementById('terminal-panel');
 
+// Entries logged in the same tick (e.g. a burst of PowerShell output lines)
+// are collected here and appended with a single DOM insert + scroll.
+let pendingLogEntries = null;
+
 function logToTerminal(message, level = 'INFO') {
     const time = new Date().toLocaleTimeString('en-US', { hour12: false });
     const entry = document.createElement('div');
     entry.className = 'log-entry';
     entry.innerHTML = `<span class="log-time">${time}</span><span class="log-level ${level}">${level}</span><span class="log-separator">│</span><span class="log-message ${level}">${escapeHtml(message)}</span>`;
-    terminalEl.appendChild(entry);
+    if (!pendingLogEntries) {
+        pendingLogEntries = document.createDocumentFragment();
+        queueMicrotask(flushTerminalLog);
+    }
+    pendingLogEntries.appendChild(entry);
+}
+
+function flushTerminalLog() {
+    if (!pendingLogEntries) return;
+    terminalEl.appendChild(pendingLogEntries);
+    pendingLogEntries = null;
     terminalEl.scrollTop = terminalEl.scrollHeight;
 }
 
@@ -443,6 +460,7 @@ function escapeHtml(text) {
 }
 
 document.getElementById('clear-terminal-btn').addEventListener('click', () => {
+    pendingLogEntries = null;
     terminalEl.innerHTML = '';
     logToTerminal('Terminal cleared.', 'INFO');
 });
@@ -502,6 +520,25 @@ const resultsOverlay = document.getElementById('results-overlay');
 const resultsTitle = document.getElementById('results-title');
 const resultsBody = document.getElementById('results-body');
 
+// Line/cell classifiers for the popup, compiled once rather than per line
+const RESULT_PATTERNS = {
+    keyValueDotted: /^([A-Za-z][A-Za-z0-9_ .]+?)\s*[.:]+\s*[:=]\s*(.+)$/,
+    keyValue: /^([A-Za-z][A-Za-z0-9_ ]+)\s*[:=]\s*(.+)$/,
+    dotLeader: /\.\s*\./g,
+    sectionHeader: /^(Ping statistics|Approximate round|Pinging |Tracing route|Trace complete|Windows IP Configuration|Ethernet adapter|Unknown adapter|Wireless LAN|Tunnel adapter)/i,
+    statLine: /^(Packets|Minimum|Maximum)\b/i,
+    statSplit: /^(\w+)\s+(.+)$/,
+    lineError: /error|failed|not found|Request timed out/i,
+    lineSuccess: /success|enabled|installed|exists|flushed/i,
+    lineWarning: /warning|disabled|not set|not exist|unreachable/i,
+    cellError: /error|failed/i,
+    cellSuccess: /success|on|enabled|started/i,
+    cellWarning: /off|disabled|warning/i,
+    valueSuccess: /enabled|on|yes|true|exists|installed|success|running/i,
+    valueWarning: /disabled|off|no|false|not|hidden|blocked/i,
+    valueError: /error|failed/i
+};
+
 function showResultsPopup(title, lines) {
     resultsTitle.textContent = title;
     resultsBody.innerHTML = '';
@@ -520,36 +557,36 @@ function showResultsPopup(title, lines) {
             const tr = document.createElement('tr');
             row.forEach(cell => {
                 const td = document.createElement('td'); td.textContent = cell;
-                if (/error|failed/i.test(cell)) td.classList.add('cell-error');
-                else if (/success|on|enabled|started/i.test(cell)) td.classList.add('cell-success');
-                else if (/off|disabled|warning/i.test(cell)) td.classList.add('cell-warning');
+                if (RESULT_PATTERNS.cellError.test(cell)) td.classList.add('cell-error');
+                else if (RESULT_PATTERNS.cellSuccess.test(cell)) td.classList.add('cell-success');
+                else if (RESULT_PATTERNS.cellWarning.test(cell)) td.classList.add('cell-warning');
                 tr.appendChild(td);
             });
             tbody.appendChild(tr);
         });
         table.appendChild(tbody); resultsBody.appendChild(table);
     } else {
+        const frag = document.createDocumentFragment();
         lines.forEach(({ text, level }) => {
             if (!text || !text.trim()) return;  // skip blank lines
             const lineEl = document.createElement('div');
             lineEl.className = 'results-line';
 
             // Key-value pairs (e.g. "IPv4 Address. . . . : 192.168.1.1")
-            const kvMatch = text.match(/^([A-Za-z][A-Za-z0-9_ .]+?)\s*[.:]+\s*[:=]\s*(.+)$/) ||
-                text.match(/^([A-Za-z][A-Za-z0-9_ ]+)\s*[:=]\s*(.+)$/);
+            const kvMatch = text.match(RESULT_PATTERNS.keyValueDotted) || text.match(RESULT_PATTERNS.keyValue);
             if (kvMatch) {
-                lineEl.innerHTML = `<span class="results-key">${escapeHtml(kvMatch[1].trim().replace(/\.\s*\./g, ''))}</span><span class="results-value ${getValueClass(kvMatch[2])}">${escapeHtml(kvMatch[2].trim())}</span>`;
-            } else if (/^(Ping statistics|Approximate round|Pinging |Tracing route|Trace complete|Windows IP Configuration|Ethernet adapter|Unknown adapter|Wireless LAN|Tunnel adapter)/i.test(text)) {
+                lineEl.innerHTML = `<span class="results-key">${escapeHtml(kvMatch[1].trim().replace(RESULT_PATTERNS.dotLeader, ''))}</span><span class="results-value ${getValueClass(kvMatch[2])}">${escapeHtml(kvMatch[2].trim())}</span>`;
+            } else if (RESULT_PATTERNS.sectionHeader.test(text)) {
                 // Section headers
                 lineEl.classList.add('results-section-header');
                 lineEl.textContent = text;
             } else {
-                if (level === 'ERROR' || /error|failed|not found|Request timed out/i.test(text)) lineEl.classList.add('error-line');
-                else if (level === 'SUCCESS' || /success|enabled|installed|exists|flushed/i.test(text)) lineEl.classList.add('success-line');
-                else if (level === 'WARNING' || /warning|disabled|not set|not exist|unreachable/i.test(text)) lineEl.classList.add('warning-line');
-                else if (/^(Packets|Minimum|Maximum)\b/i.test(text)) {
+                if (level === 'ERROR' || RESULT_PATTERNS.lineError.test(text)) lineEl.classList.add('error-line');
+                else if (level === 'SUCCESS' || RESULT_PATTERNS.lineSuccess.test(text)) lineEl.classList.add('success-line');
+                else if (level === 'WARNING' || RESULT_PATTERNS.lineWarning.test(text)) lineEl.classList.add('warning-line');
+                else if (RESULT_PATTERNS.statLine.test(text)) {
                     // Stats lines — split into key/value
-                    const statMatch = text.match(/^(\w+)\s+(.+)$/);
+                    const statMatch = text.match(RESULT_PATTERNS.statSplit);
                     if (statMatch) {
                         lineEl.innerHTML = `<span class="results-key">${escapeHtml(statMatch[1])}</span><span class="results-value">${escapeHtml(statMatch[2])}</span>`;
                     } else {
@@ -559,8 +596,9 @@ function showResultsPopup(title, lines) {
                     lineEl.textContent = text;
                 }
             }
-            resultsBody.appendChild(lineEl);
+            frag.appendChild(lineEl);
         });
+        resultsBody.appendChild(frag);
     }
     resultsOverlay.classList.remove('hidden');
 }
@@ -590,9 +628,9 @@ function parseTableOutput(textLines) {
 }
 
 function getValueClass(v) {
-    if (/enabled|on|yes|true|exists|installed|success|running/i.test(v)) return 'value-success';
-    if (/disabled|off|no|false|not|hidden|blocked/i.test(v)) return 'value-warning';
-    if (/error|failed/i.test(v)) return 'value-error';
+    if (RESULT_PATTERNS.valueSuccess.test(v)) return 'value-success';
+    if (RESULT_PATTERNS.valueWarning.test(v)) return 'value-warning';
+    if (RESULT_PATTERNS.valueError.test(v)) return 'value-error';
     return '';
 }
 
@@ -709,6 +747,15 @@ themeToggle.addEventListener('click', () => applyTheme(currentTheme === 'dark' ?
 // Batch Operations
 // ──────────────────────────────────────────────
 
+// Install runners keyed by button action — shared by the batch installer and
+// handleAction so both dispatch with a single lookup.
+const INSTALL_ACTIONS = {
+    powershell: (btn) => window.invokeX.runPowerShell(btn.command),
+    exe: (btn, item) => window.invokeX.downloadAndInstallExe(btn.url, item.name),
+    portable: (btn, item) => window.invokeX.downloadPortable(btn.url, item.name),
+    msi: (btn, item) => window.invokeX.downloadAndInstallMsi(btn.url, item.name),
+};
+
 const batchBar = document.getElementById('batch-bar');
 const batchCount = document.getElementById('batch-count');
 const selectedApps = new Set();
@@ -734,12 +781,8 @@ document.getElementById('batch-install-btn').addEventListener('click', async ()
         const btn = app.buttons[0]; // First button is always install
         logToTerminal(`Batch installing: ${app.name}`, 'INFO');
         try {
-            switch (btn.action) {
-                case 'powershell': await window.invokeX.runPowerShell(btn.command); break;
-                case 'exe': await window.invokeX.downloadAndInstallExe(btn.url, app.name); break;
-                case 'portable': await window.invokeX.downloadPortable(btn.url, app.name); break;
-                case 'msi': await window.invokeX.downloadAndInstallMsi(btn.url, app.name); break;
-            }
+            const run = INSTALL_ACTIONS[btn.action];
+            if (run) await run(btn, app);
             showToast(`${app.name} installed`, 'success');
         } catch (err) { showToast(`Failed: ${app.name}`, 'error'); }
     }
@@ -917,18 +960,10 @@ async function handleAction(btnDef, item, btnEl) {
                 showToast(`${item.name} launched in a new window`, 'success');
                 break;
             case 'exe':
-                await window.invokeX.downloadAndInstallExe(btnDef.url, item.name);
-                showToast(`${item.name} installed`, 'success');
-                if (item.checkName) setTimeout(() => checkAppStatus(item, `status-${item.id}`), 3000);
-                break;
             case 'portable':
-                await window.invokeX.downloadPortable(btnDef.url, item.name);
-                showToast(`${item.name} saved to Desktop`, 'success');
-                if (item.checkName) setTimeout(() => checkAppStatus(item, `status-${item.id}`), 3000);
-                break;
             case 'msi':
-                await window.invokeX.downloadAndInstallMsi(btnDef.url, item.name);
-                showToast(`${item.name} installed`, 'success');
+                await INSTALL_ACTIONS[btnDef.action](btnDef, item);
+                showToast(btnDef.action === 'portable' ? `${item.name} saved to Desktop` : `${item.name} installed`, 'success');
                 if (item.checkName) setTimeout(() => checkAppStatus(item, `status-${item.id}`), 3000);
                 break;
             case 'custom':
@@ -954,11 +989,15 @@ async function handleAction(btnDef, item, btnEl) {
 // Password Dialog
 // ──────────────────────────────────────────────
 
-function showPasswordDialog() {
-    return new Promise((resolve) => {
-        const overlay = document.createElement('div');
-        overlay.className = 'dialog-overlay';
-        overlay.innerHTML = `
+// Built on first use, then kept in the DOM (hidden) and reused like the
+// confirm dialog.
+let passwordOverlay = null;
+
+function getPasswordOverlay() {
+    if (passwordOverlay) return passwordOverlay;
+    passwordOverlay = document.createElement('div');
+    passwordOverlay.className = 'dialog-overlay hidden';
+    passwordOverlay.innerHTML = `
       <div class="dialog-box">
         <div class="dialog-title">Create Admin Account</div>
         <div class="dialog-desc">Enter a password for the new Admin account. Must be at least 8 characters.</div>
@@ -970,18 +1009,34 @@ function showPasswordDialog() {
           <button class="btn btn-primary" id="dialog-ok">Create Account</button>
         </div>
       </div>`;
-        document.body.appendChild(overlay);
+    document.body.appendChild(passwordOverlay);
+    const okBtn = document.getElementById('dialog-ok');
+    ['dialog-password', 'dialog-password-confirm'].forEach(id => {
+        document.getElementById(id).addEventListener('keydown', e => { if (e.key === 'Enter') okBtn.click(); });
+    });
+    return passwordOverlay;
+}
+
+function showPasswordDialog() {
+    return new Promise((resolve) => {
+        const overlay = getPasswordOverlay();
         const pwIn = document.getElementById('dialog-password');
         const cfIn = document.getElementById('dialog-password-confirm');
+        [pwIn, cfIn].forEach(el => { el.value = ''; el.style.borderColor = ''; });
+        overlay.classList.remove('hidden');
         pwIn.focus();
-        document.getElementById('dialog-cancel').onclick = () => { overlay.remove(); resolve(null); };
+        const cleanup = (result) => {
+            overlay.classList.add('hidden');
+            pwIn.value = cfIn.value = '';
+            resolve(result);
+        };
+        document.getElementById('dialog-cancel').onclick = () => cleanup(null);
         document.getElementById('dialog-ok').onclick = () => {
             if (pwIn.value.length < 8) { pwIn.style.borderColor = 'var(--error)'; return; }
             if (pwIn.value !== cfIn.value) { cfIn.style.borderColor = 'var(--error)'; return; }
-            overlay.remove(); resolve(pwIn.value);
+            cleanup(pwIn.value);
         };
-        [pwIn, cfIn].forEach(el => el.addEventListener('keydown', e => { if (e.key === 'Enter') document.getElementById('dialog-ok').click(); }));
-        overlay.addEventListener('click', e => { if (e.target === overlay) { overlay.remove(); resolve(null); } });
+        overlay.onclick = (e) => { if (e.target === overlay) cleanup(null); };
     });
 }
 
@@ -1185,8 +1240,12 @@ function showStartupRemoveDialog() {
 // Download Progress
 // ──────────────────────────────────────────────
 
+// Progress events arrive many times per download — resolve the app by name
+// with a prebuilt map rather than scanning APPS on every event.
+const APPS_BY_NAME = new Map(APPS.map(a => [a.name, a]));
+
 window.invokeX.onDownloadProgress((data) => {
-    const app = APPS.find(a => a.name === data.appName);
+    const app = APPS_BY_NAME.get(data.appName);
     if (app) {
         const container = document.getElementById(`progress-${app.id}`);
         if (container) {
@@ -1201,20 +1260,26 @@ window.invokeX.onDownloadProgress((data) => {
 // Sidebar Shortcut Buttons
 // ──────────────────────────────────────────────
 
-document.getElementById('shortcut-controlpanel').addEventListener('click', async () => {
-    await window.invokeX.runPowerShell("Start-Process control.exe; Write-Host 'Control Panel opened.'");
-    showToast('Control Panel opened', 'info');
-});
+async function launchShortcut(toolId, label) {
+    const result = await window.invokeX.launchTool(toolId);
+    if (result.error) {
+        logToTerminal(`Failed to open ${label}: ${result.error}`, 'ERROR');
+        showToast(`Failed to open ${label}`, 'error');
+        return;
+    }
+    logToTerminal(`${label} opened.`, 'INFO');
+    showToast(`${label} opened`, 'info');
+}
+
+document.getElementById('shortcut-controlpanel').addEventListener('click', () => launchShortcut('control-panel', 'Control Panel'));
 
 document.getElementById('shortcut-settings').addEventListener('click', async () => {
-    await window.invokeX.runPowerShell("Start-Process ms-settings:; Write-Host 'Settings opened.'");
+    await window.invokeX.openUrl('ms-settings:');
+    logToTerminal('Settings opened.', 'INFO');
     showToast('Windows Settings opened', 'info');
 });
 
-document.getElementById('shortcut-terminal').addEventListener('click', async () => {
-    await window.invokeX.runPowerShell("Start-Process wt.exe; Write-Host 'Windows Terminal opened.'");
-    showToast('Windows Terminal opened', 'info');
-});
+document.getElementById('shortcut-terminal').addEventListener('click', () => launchShortcut('terminal', 'Windows Terminal'));
 
 document.getElementById('shortcut-reboot').addEventListener('click', async () => {
     const ok = await showConfirmDialog('Restart PC', 'Are you sure you want to restart this computer? All unsaved work will be lost.');
@@ -1252,51 +1317,6 @@ document.addEventListener('keydown', (e) => {
     }
 });
 
-// ──────────────────────────────────────────────
-// System Info
-// ──────────────────────────────────────────────
-
-async function loadSystemInfo() {
-    const infoEl = document.getElementById('system-info');
-    if (!infoEl) return;
-    try {
-        const info = await window.invokeX.runPowerShell(`
-      $cpu=(Get-CimInstance Win32_Processor).Name -replace '\\s+',' ';
-      $ram=[math]::Round((Get-CimInstance Win32_ComputerSystem).TotalPhysicalMemory/1GB,1);
-      $disk=Get-CimInstance Win32_LogicalDisk -Filter "DeviceID='C:'";
-      $diskFree=[math]::Round($disk.FreeSpace/1GB,1);
-      $diskTotal=[math]::Round($disk.Size/1GB,1);
-      $ip=(Get-NetIPAddress -AddressFamily IPv4|Where-Object{$_.InterfaceAlias -notlike '*Loopback*' -and $_.PrefixOrigin -ne 'WellKnown'}|Select-Object -First 1).IPAddress;
-      $uptime=(Get-Date)-(Get-CimInstance Win32_OperatingSystem).LastBootUpTime;
-      $uptimeStr='{0}d {1}h {2}m' -f $uptime.Days,$uptime.Hours,$uptime.Minutes;
-      Write-Host "CPU|$cpu";
-      Write-Host "RAM|$ram GB";
-      Write-Host "Disk (C:)|$diskFree / $diskTotal GB free";
-      Write-Host "IP|$ip";
-      Write-Host "Uptime|$uptimeStr";
-    `);
-    } catch { }
-
-    // Parse from captured terminal output after a delay
-    setTimeout(() => {
-        const entries = [];
-        const logEntries = terminalEl.querySelectorAll('.log-message');
-        logEntries.forEach(el => {
-            const text = el.textContent;
-            if (text.includes('|') && ['CPU', 'RAM', 'Disk', 'IP', 'Uptime'].some(k => text.startsWith(k))) {
-                const [label, value] = text.split('|');
-                entries.push({ label: label.trim(), value: value.trim() });
-            }
-        });
-
-        if (entries.length > 0) {
-            infoEl.innerHTML = entries.map(e =>
-                `<div class="sys-info-row"><span class="sys-info-label">${escapeHtml(e.label)}</span><span class="sys-info-value">${escapeHtml(e.value)}</span></div>`
-            ).join('');
-        }
-    }, 3000);
-}
-
 // ──────────────────────────────────────────────
 // System Info Dashboard (Full Page)
 // ──────────────────────────────────────────────
@@ -1523,25 +1543,8 @@ async function runNetTriage() {
     logToTerminal('NetTriage: Starting network diagnostics...', 'INFO');
 
     try {
-        // 1. Environment + External IP
-        netdiagStatusText.textContent = 'Checking network environment...';
-        await window.invokeX.runPowerShell(`
-      $ErrorActionPreference='SilentlyContinue'
-      $cfg=Get-NetIPConfiguration|Where-Object{$_.NetAdapter.Status -eq 'Up' -and $_.IPv4DefaultGateway -and $_.IPv4Address}|Sort-Object @{Expression={if($_.InterfaceAlias -match 'Wi-?Fi|Ethernet'){0}else{1}}}|Select-Object -First 1
-      if($cfg){
-        Write-Host "NETDIAG_GW|$($cfg.IPv4DefaultGateway.NextHop)"
-        Write-Host "NETDIAG_IP|$($cfg.IPv4Address.IPAddress)"
-        Write-Host "NETDIAG_IFACE|$($cfg.InterfaceAlias)"
-      }else{
-        Write-Host "NETDIAG_GW|NONE"; Write-Host "NETDIAG_IP|NONE"; Write-Host "NETDIAG_IFACE|NONE"
-      }
-      $dns=if($cfg){$cfg.DnsServer.ServerAddresses|Where-Object{$_ -match '^[0-9]+\\.[0-9]+\\.[0-9]+\\.[0-9]+$'}|Select-Object -First 1}else{$null}
-      if($dns){Write-Host "NETDIAG_DNS|$dns"}else{Write-Host "NETDIAG_DNS|NONE"}
-      try{$ext=(Invoke-RestMethod -Uri 'https://api.ipify.org' -TimeoutSec 5);Write-Host "NETDIAG_EXTIP|$ext"}catch{Write-Host "NETDIAG_EXTIP|FAILED"}
-    `);
-
-        // 2. Latency (ping with ms) — PS 5.1 compatible
         netdiagStatusText.textContent = 'Measuring latency...';
+        // 2. Latency (ping with ms) — PS 5.1 compatible
         await window.invokeX.runPowerShell(`
       $ErrorActionPreference='SilentlyContinue'
       $cfg=Get-NetIPConfiguration|Where-Object{$_.NetAdapter.Status -eq 'Up' -and $_.IPv4DefaultGateway}|Select-Object -First 1
@@ -1560,17 +1563,36 @@ async function runNetTriage() {
       Write-Host "NETDIAG_LAT_GOOGLE|$(Get-PingMs '8.8.8.8')"
     `);
 
-        // 3. TCP 443
-        netdiagStatusText.textContent = 'Testing TCP 443 connectivity...';
-        await window.invokeX.runPowerShell(`
+        // Steps 1, 3, 4 and 5 are independent probes, so run them side by side
+        // (their NETDIAG_ keys don't overlap). Latency runs first, on its own,
+        // so the other probes don't inflate the measured round-trip times.
+        netdiagStatusText.textContent = 'Checking environment, TCP, DNS and HTTP...';
+        await Promise.all([
+            // 1. Environment + External IP
+            window.invokeX.runPowerShell(`
+      $ErrorActionPreference='SilentlyContinue'
+      $cfg=Get-NetIPConfiguration|Where-Object{$_.NetAdapter.Status -eq 'Up' -and $_.IPv4DefaultGateway -and $_.IPv4Address}|Sort-Object @{Expression={if($_.InterfaceAlias -match 'Wi-?Fi|Ethernet'){0}else{1}}}|Select-Object -First 1
+      if($cfg){
+        Write-Host "NETDIAG_GW|$($cfg.IPv4DefaultGateway.NextHop)"
+        Write-Host "NETDIAG_IP|$($cfg.IPv4Address.IPAddress)"
+        Write-Host "NETDIAG_IFACE|$($cfg.InterfaceAlias)"
+      }else{
+        Write-Host "NETDIAG_GW|NONE"; Write-Host "NETDIAG_IP|NONE"; Write-Host "NETDIAG_IFACE|NONE"
+      }
+      $dns=if($cfg){$cfg.DnsServer.ServerAddresses|Where-Object{$_ -match '^[0-9]+\\.[0-9]+\\.[0-9]+\\.[0-9]+$'}|Select-Object -First 1}else{$null}
+      if($dns){Write-Host "NETDIAG_DNS|$dns"}else{Write-Host "NETDIAG_DNS|NONE"}
+      try{$ext=(Invoke-RestMethod -Uri 'https://api.ipify.org' -TimeoutSec 5);Write-Host "NETDIAG_EXTIP|$ext"}catch{Write-Host "NETDIAG_EXTIP|FAILED"}
+    `),
+
+            // 3. TCP 443
+            window.invokeX.runPowerShell(`
       $ErrorActionPreference='SilentlyContinue'
       Write-Host "NETDIAG_TCP_1111|$([bool](Test-NetConnection -ComputerName '1.1.1.1' -Port 443 -InformationLevel Quiet))"
       Write-Host "NETDIAG_TCP_8888|$([bool](Test-NetConnection -ComputerName '8.8.8.8' -Port 443 -InformationLevel Quiet))"
-    `);
+    `),
 
-        // 4. DNS Resolution
-        netdiagStatusText.textContent = 'Testing DNS resolution...';
-        await window.invokeX.runPowerShell(`
+            // 4. DNS Resolution
+            window.invokeX.runPowerShell(`
       $ErrorActionPreference='SilentlyContinue'
       $count=0
       @('openai.com','bbc.co.uk','cloudflare.com','microsoft.com')|ForEach-Object{
@@ -1578,11 +1600,10 @@ async function runNetTriage() {
         Write-Host "NETDIAG_DNS_$($_.Replace('.','_'))|$ok"
       }
       Write-Host "NETDIAG_DNS_COUNT|$count"
-    `);
+    `),
 
-        // 5. HTTP/S Requests
-        netdiagStatusText.textContent = 'Testing HTTP connectivity...';
-        await window.invokeX.runPowerShell(`
+            // 5. HTTP/S Requests
+            window.invokeX.runPowerShell(`
       $ErrorActionPreference='SilentlyContinue'
       $count=0
       @('https://www.google.com','https://openai.com','https://www.bbc.co.uk','https://cloudflare.com')|ForEach-Object{
@@ -1591,7 +1612,8 @@ async function runNetTriage() {
         Write-Host "NETDIAG_HTTP_$name|$ok"
       }
       Write-Host "NETDIAG_HTTP_COUNT|$count"
-    `);
+    `)
+        ]);
 
         // 6. Speed Test (download) — uses WebClient for real throughput
         netdiagStatusText.textContent = 'Running speed test (download)...';
@@ -1792,8 +1814,8 @@ document.getElementById('ping-run-btn').addEventListener('click', async () => {
     const pingCmd = count > 0 ? `ping ${safe} -n ${count}` : `ping ${safe} -t`;
     logToTerminal(`Running: ${pingCmd}`, 'INFO');
     const cmd = doLog
-        ? `Write-Host 'Pinging ${safe}...';$out=cmd /c '${pingCmd}';$out|ForEach-Object{Write-Host $_};$out|Out-File "$env:USERPROFILE\\Desktop\\ping_${safe.replace(/\./g, '_')}.log" -Encoding UTF8;Write-Host '';Write-Host 'Log saved to Desktop.'`
-        : `Write-Host 'Pinging ${safe}...';cmd /c '${pingCmd}'|ForEach-Object{Write-Host $_}`;
+        ? `Write-Host 'Pinging ${safe}...';$out=${pingCmd};$out|ForEach-Object{Write-Host $_};$out|Out-File "$env:USERPROFILE\\Desktop\\ping_${safe.replace(/\./g, '_')}.log" -Encoding UTF8;Write-Host '';Write-Host 'Log saved to Desktop.'`
+        : `Write-Host 'Pinging ${safe}...';${pingCmd}|ForEach-Object{Write-Host $_}`;
     await runAndShowPopup(`Ping — ${safe}`, cmd);
 });
 
@@ -1803,8 +1825,8 @@ document.getElementById('tracert-run-btn').addEventListener('click', async () =>
     const safe = addr.replace(/[^a-zA-Z0-9.-]/g, '');
     logToTerminal(`Running: tracert ${safe}`, 'INFO');
     const cmd = doLog
-        ? `Write-Host 'Tracing route to ${safe}...';$out=cmd /c 'tracert ${safe}';$out|ForEach-Object{Write-Host $_};$out|Out-File "$env:USERPROFILE\\Desktop\\tracert_${safe.replace(/\./g, '_')}.log" -Encoding UTF8;Write-Host '';Write-Host 'Log saved to Desktop.'`
-        : `Write-Host 'Tracing route to ${safe}...';cmd /c 'tracert ${safe}'|ForEach-Object{Write-Host $_}`;
+        ? `Write-Host 'Tracing route to ${safe}...';$out=tracert ${safe};$out|ForEach-Object{Write-Host $_};$out|Out-File "$env:USERPROFILE\\Desktop\\tracert_${safe.replace(/\./g, '_')}.log" -Encoding UTF8;Write-Host '';Write-Host 'Log saved to Desktop.'`
+        : `Write-Host 'Tracing route to ${safe}...';tracert ${safe}|ForEach-Object{Write-Host $_}`;
     await runAndShowPopup(`Traceroute — ${safe}`, cmd);
 });
 
@@ -1844,7 +1866,7 @@ document.getElementById('lattest-run-btn').addEventListener('click', async () =>
     logToTerminal(`Latency Test: ${safeDest}:${port} (ping×${pingCount}, tcp×${tcpCount})`, 'INFO');
 
     const tracertBlock = doTracert
-        ? `Write-Host '';Write-Host '---- Traceroute ----';cmd /c "tracert -d ${safeDest}"|ForEach-Object{Write-Host $_}`
+        ? `Write-Host '';Write-Host '---- Traceroute ----';tracert -d ${safeDest}|ForEach-Object{Write-Host $_}`
         : '';
 
     const cmd = `
@@ -1913,7 +1935,8 @@ else{Write-Host '  ✅ Looks generally OK'}
 async function initialize() {
     logToTerminal('InvokeX v2.0 starting...', 'INFO');
 
-    const isAdmin = await window.invokeX.checkAdmin();
+    // Both probes are started by the main process at launch; wait for them together
+    const [isAdmin, winVer] = await Promise.all([window.invokeX.checkAdmin(), window.invokeX.getWindowsVersion()]);
     const adminStatus = document.getElementById('admin-status');
     const statusDot = adminStatus.querySelector('.status-dot');
     const statusText = adminStatus.querySelector('.status-text');
@@ -1933,13 +1956,11 @@ async function initialize() {
         setTimeout(() => banner.classList.add('hidden'), 10000);
     }
 
-    const winVer = await window.invokeX.getWindowsVersion();
     document.getElementById('windows-version').textContent = winVer;
     document.getElementById('tweaks-subtitle').textContent = `Customize Windows settings and behavior • ${winVer}`;
 
     APPS.forEach(renderAppCard);
     TWEAKS.forEach(renderTweakCard);
-    // loadSystemInfo removed — info now on the System page
 
     logToTerminal('Ready. Press Ctrl+K to search.', 'SUCCESS');
     showToast('InvokeX v2.0 ready', 'info');